@@ -18,6 +18,7 @@ CREATE TABLE IF NOT EXISTS weather_alerts (
     message_type TEXT,
     sender_name TEXT,
     web TEXT,
+    geometry_type TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
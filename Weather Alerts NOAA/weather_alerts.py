@@ -1,8 +1,167 @@
 import requests
 import json
+import os
+import re
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import datetime, timedelta
+from pathlib import Path
 import numpy as np
+import pyarrow as pa
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # fall back to the stdlib parser
+    _json_loads = json.loads
+
+# Shared HTTP session so repeated calls reuse the keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'noaa-alerts-analysis/1.0',  # NOAA requires a User-Agent
+    'Accept': 'application/geo+json'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# NOAA GeoJSON feature fields ("section.key") -> DataFrame columns
+ALERT_FIELDS = {
+    'properties.id': 'id',
+    'properties.areaDesc': 'area_desc',
+    'properties.event': 'event',
+    'properties.severity': 'severity',
+    'properties.certainty': 'certainty',
+    'properties.urgency': 'urgency',
+    'properties.headline': 'headline',
+    'properties.description': 'description',
+    'properties.instruction': 'instruction',
+    'properties.sent': 'sent',
+    'properties.effective': 'effective',
+    'properties.expires': 'expires',
+    'properties.status': 'status',
+    'properties.messageType': 'message_type',
+    'properties.senderName': 'sender_name',
+    'properties.web': 'web',
+    'geometry.type': 'geometry_type'
+}
+
+# (section, key, column) triples so extraction needs no per-row path handling
+_ALERT_FIELD_PATHS = tuple((*path.split('.'), column) for path, column in ALERT_FIELDS.items())
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORY_COLUMNS = (
+    'event', 'severity', 'certainty', 'urgency',
+    'status', 'message_type', 'sender_name', 'geometry_type'
+)
+
+# Matches Texas in area descriptions (e.g. "Travis, TX; Williamson, TX")
+_TEXAS_PATTERN = re.compile(r'TX|Texas', re.IGNORECASE)
+
+# Columnar, dictionary-encoded Parquet output (pairs well with the categorical columns)
+PARQUET_OPTIONS = {'engine': 'pyarrow', 'compression': 'zstd', 'use_dictionary': True}
+
+# Multi-KB free-text columns that can be left out of the Parquet dataset
+LARGE_TEXT_COLUMNS = ('description', 'instruction')
+
+# Column order for the weather_alerts SQLite table (see NOAA.sql)
+SQLITE_COLUMNS = tuple(ALERT_FIELDS.values())
+
+# Same DDL as NOAA.sql, so the exported table keeps its primary key and created_at
+SQLITE_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS weather_alerts (
+        id TEXT PRIMARY KEY,
+        area_desc TEXT,
+        event TEXT,
+        severity TEXT,
+        certainty TEXT,
+        urgency TEXT,
+        headline TEXT,
+        description TEXT,
+        instruction TEXT,
+        sent TEXT,
+        effective TEXT,
+        expires TEXT,
+        status TEXT,
+        message_type TEXT,
+        sender_name TEXT,
+        web TEXT,
+        geometry_type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Conditional-GET cache for the NOAA response (ETag/Last-Modified validators)
+CACHE_DIR = Path.home() / '.cache'
+CACHE_META_PATH = CACHE_DIR / 'noaa_alerts.json'
+CACHE_DATA_PATH = CACHE_DIR / 'noaa_alerts.parquet'
+CACHE_MAX_AGE = timedelta(hours=1)
+
+def _load_cache_headers():
+    """
+    Return conditional request headers if a usable cached response exists
+    """
+    if not (CACHE_META_PATH.exists() and CACHE_DATA_PATH.exists()):
+        return {}
+    
+    # Cap cache age so stale data is refetched even if validators keep matching
+    cached_at = datetime.fromtimestamp(CACHE_META_PATH.stat().st_mtime)
+    if datetime.now() - cached_at > CACHE_MAX_AGE:
+        return {}
+    
+    try:
+        with open(CACHE_META_PATH) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+def _save_cache(df, response):
+    """
+    Persist the parsed alerts and the response validators for the next run
+    """
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if df.empty or not (etag or last_modified):
+        return
+    
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        
+        # Write to temp files and swap them in, so a failed write never leaves
+        # a truncated parquet behind a still-fresh meta file
+        data_tmp = CACHE_DATA_PATH.with_name(CACHE_DATA_PATH.name + '.tmp')
+        df.to_parquet(data_tmp, index=False, **PARQUET_OPTIONS)
+        os.replace(data_tmp, CACHE_DATA_PATH)
+        
+        meta_tmp = CACHE_META_PATH.with_name(CACHE_META_PATH.name + '.tmp')
+        with open(meta_tmp, 'w') as f:
+            json.dump({'etag': etag, 'last_modified': last_modified}, f)
+        os.replace(meta_tmp, CACHE_META_PATH)
+    except (OSError, pa.ArrowException) as e:
+        print(f"⚠️  Could not write response cache: {e}")
+
+def _read_cache():
+    """
+    Load the cached alerts, or return None if the cache is missing or unreadable
+    """
+    try:
+        return pd.read_parquet(CACHE_DATA_PATH)
+    except (OSError, pa.ArrowException) as e:
+        print(f"⚠️  Could not read response cache: {e}")
+        return None
 
 def fetch_weather_alerts():
     """
@@ -12,46 +171,45 @@ def fetch_weather_alerts():
     
     try:
         print("Making API request to NOAA Weather Service...")
-        response = requests.get(url)
+        response = _SESSION.get(url, headers=_load_cache_headers(), timeout=(3.05, 30))
+        
+        if response.status_code == 304:
+            df = _read_cache()
+            if df is not None:
+                print(f"✅ Alerts unchanged since last run (HTTP 304); loaded {len(df)} alerts from cache")
+                return df
+            
+            # Cache vanished or is corrupt; fall back to an unconditional request
+            response = _SESSION.get(url, timeout=(3.05, 30))
+        
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         print(f"API Response: {len(data.get('features', []))} alerts found")
         
-        # Extract alerts from the features array
-        alerts_data = []
-        for feature in data.get('features', []):
-            properties = feature.get('properties', {})
-            geometry = feature.get('geometry', {})
-            
-            alert = {
-                'id': properties.get('id'),
-                'area_desc': properties.get('areaDesc'),
-                'event': properties.get('event'),
-                'severity': properties.get('severity'),
-                'certainty': properties.get('certainty'),
-                'urgency': properties.get('urgency'),
-                'headline': properties.get('headline'),
-                'description': properties.get('description'),
-                'instruction': properties.get('instruction'),
-                'sent': properties.get('sent'),
-                'effective': properties.get('effective'),
-                'expires': properties.get('expires'),
-                'status': properties.get('status'),
-                'message_type': properties.get('messageType'),
-                'sender_name': properties.get('senderName'),
-                'web': properties.get('web'),
-                'geometry_type': geometry.get('type') if geometry else None
-            }
-            alerts_data.append(alert)
-        
-        # Create DataFrame
-        df = pd.DataFrame(alerts_data)
+        # The schema is fixed, so pull each known field straight into its column
+        # instead of generically flattening every (mostly unused) nested property
+        features = data.get('features', [])
+        sections = {
+            'properties': [feature.get('properties') or {} for feature in features],
+            'geometry': [feature.get('geometry') or {} for feature in features]
+        }
+        df = pd.DataFrame({
+            column: [record.get(key) for record in sections[section]]
+            for section, key, column in _ALERT_FIELD_PATHS
+        })
         
         # Convert datetime columns with UTC timezone handling
+        # (NOAA emits strict ISO8601, so skip format inference and cache repeated values)
         datetime_columns = ['sent', 'effective', 'expires']
         for col in datetime_columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+            df[col] = pd.to_datetime(df[col], errors='coerce', utc=True, format='ISO8601', cache=True)
+        
+        # Categorical codes make value_counts/isin/groupby cheaper and shrink memory
+        for col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype('category')
+        
+        _save_cache(df, response)
         
         print(f"✅ Created DataFrame with {len(df)} alerts")
         return df
@@ -60,24 +218,88 @@ def fetch_weather_alerts():
         print(f"Error fetching data: {e}")
         return pd.DataFrame()
 
-def save_dataframe(df, file_formats=['csv', 'parquet']):
+def _compact_for_parquet(df, include_text=True):
+    """
+    Return a leaner copy of df for Parquet: 32-bit integers, pyarrow-backed strings
+    """
+    compact = df if include_text else df.drop(columns=list(LARGE_TEXT_COLUMNS))
+    # Plain string columns only (object on pandas 2, str on pandas 3; categoricals keep their codes)
+    string_columns = [
+        col for col in compact
+        if pd.api.types.is_string_dtype(compact[col]) and not isinstance(compact[col].dtype, pd.CategoricalDtype)
+    ]
+    compact = compact.astype({col: 'string[pyarrow]' for col in string_columns})
+    # Fixed widths (not value-based downcasting) so the schema is the same on every run
+    compact = compact.astype({
+        col: 'Int32' if isinstance(compact[col].dtype, pd.api.extensions.ExtensionDtype) else 'int32'
+        for col in compact.select_dtypes(include='integer').columns
+    })
+    return compact
+
+def save_dataframe(df, file_formats=['parquet'], include_text=True):
     """
-    Save DataFrame to multiple formats for analysis
+    Save DataFrame for analysis (Parquet by default; CSV, JSON and SQLite on request)
+    
+    Set include_text=False to leave the large description/instruction columns
+    out of the Parquet file when they are not needed downstream.
+    
+    Returns the list of files written; the caller reports them, so this is
+    safe to run in a background thread without interleaving terminal output.
     """
     if df.empty:
         print("❌ No data to save")
-        return
+        return []
     
+    saved = []
     for fmt in file_formats:
         if fmt == 'csv':
             df.to_csv('weather_alerts.csv', index=False)
-            print(f"✅ Saved to weather_alerts.csv")
+            saved.append('weather_alerts.csv')
         elif fmt == 'parquet':
-            df.to_parquet('weather_alerts.parquet', index=False)
-            print(f"✅ Saved to weather_alerts.parquet")
+            _compact_for_parquet(df, include_text).to_parquet('weather_alerts.parquet', index=False, **PARQUET_OPTIONS)
+            saved.append('weather_alerts.parquet')
         elif fmt == 'json':
             df.to_json('weather_alerts.json', orient='records', indent=2)
-            print(f"✅ Saved to weather_alerts.json")
+            saved.append('weather_alerts.json')
+        elif fmt == 'sqlite':
+            saved.append(save_to_sqlite(df))
+    return saved
+
+def save_to_sqlite(df, db_path='weather_alerts.db'):
+    """
+    Export the already-typed DataFrame to SQLite (optional; analysis runs on the DataFrame)
+    
+    Returns the database path written.
+    """
+    if df.empty:
+        print("❌ No data to save")
+        return None
+    
+    export = df[list(SQLITE_COLUMNS)].copy()
+    
+    # Store datetimes as ISO8601 text so SQLite's datetime() can parse them
+    for col in ['sent', 'effective', 'expires']:
+        export[col] = export[col].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        
+        # Replace the previous snapshot inside the NOAA.sql schema, using
+        # multi-row INSERTs kept under SQLite's default 999 bound-parameter limit
+        with conn:
+            conn.execute(SQLITE_CREATE_TABLE)
+            conn.execute('DELETE FROM weather_alerts')
+            export.to_sql(
+                'weather_alerts', conn, if_exists='append', index=False,
+                method='multi', chunksize=999 // len(SQLITE_COLUMNS)
+            )
+    finally:
+        conn.close()
+    
+    return db_path
 
 def run_analytical_queries(df):
     """
@@ -87,6 +309,11 @@ def run_analytical_queries(df):
         print("❌ No data to analyze")
         return {}
     
+    # Single reference time so every query sees the same "now"
+    now = pd.Timestamp.now(tz='UTC')
+    one_week_ago = now - timedelta(days=7)
+    now_ns = now.value
+    
     print("\n" + "="*60)
     print("ANALYTICAL QUERIES RESULTS")
     print("="*60)
@@ -100,8 +327,8 @@ def run_analytical_queries(df):
     # Query 2: Alerts by Severity
     print("\n2. ALERTS BY SEVERITY LEVEL:")
     print("-" * 40)
-    severity_counts = df['severity'].value_counts()
-    severity_pct = (df['severity'].value_counts(normalize=True) * 100).round(2)
+    severity_counts = df['severity'].value_counts(dropna=True)
+    severity_pct = (severity_counts * (100.0 / severity_counts.sum())).round(2)
     severity_analysis = pd.DataFrame({
         'alert_count': severity_counts,
         'percentage': severity_pct
@@ -111,35 +338,30 @@ def run_analytical_queries(df):
     # Query 3: Texas Alerts
     print("\n3. ALERTS IN TEXAS:")
     print("-" * 40)
-    texas_mask = df['area_desc'].str.contains('TX|Texas', case=False, na=False)
-    texas_alerts = df[texas_mask]
+    # Area strings repeat heavily, so match each distinct value once and map back
+    unique_areas = df['area_desc'].dropna().drop_duplicates().astype('string')
+    texas_lookup = dict(zip(unique_areas, unique_areas.str.contains(_TEXAS_PATTERN)))
+    texas_mask = df['area_desc'].map(texas_lookup).eq(True)
     
     # This week filter (make timezone-aware)
-    one_week_ago = pd.Timestamp.now(tz='UTC') - timedelta(days=7)
-    texas_this_week = texas_alerts[texas_alerts['sent'] > one_week_ago]
+    texas_this_week_mask = texas_mask & (df['sent'] > one_week_ago)
     
     texas_summary = pd.DataFrame({
         'metric': ['total_texas_alerts', 'texas_alerts_this_week'],
-        'count': [len(texas_alerts), len(texas_this_week)]
+        'count': [int(texas_mask.sum()), int(texas_this_week_mask.sum())]
     })
     print(texas_summary.to_string(index=False))
     
     # Query 4: Time-based Analysis - Expiration Status
     print("\n4. TIME-BASED ANALYSIS - EXPIRATION STATUS:")
     print("-" * 40)
-    now = pd.Timestamp.now(tz='UTC')
-    
-    def get_expiration_status(row):
-        if pd.isna(row['expires']):
-            return 'No Expiration Set'
-        elif row['expires'] < now:
-            return 'Expired'
-        elif row['expires'] > now:
-            return 'Active'
-        else:
-            return 'Unknown'
-    
-    df['expiration_status'] = df.apply(get_expiration_status, axis=1)
+    # Vectorized status assignment (comparisons run over the whole column at once)
+    expires = df['expires']
+    df['expiration_status'] = pd.Categorical(np.select(
+        [expires.isna(), expires < now, expires > now],
+        ['No Expiration Set', 'Expired', 'Active'],
+        default='Unknown'
+    ))
     expiration_counts = df['expiration_status'].value_counts()
     print(expiration_counts.to_string())
     
@@ -152,7 +374,8 @@ def run_analytical_queries(df):
     ) & (df['status'] == 'Actual')
     
     active_alerts = df[active_mask]
-    top_areas = active_alerts['area_desc'].value_counts().head(10)
+    # Top-k selection instead of sorting the whole (high-cardinality) histogram
+    top_areas = active_alerts['area_desc'].value_counts(sort=False).nlargest(10)
     print(top_areas.to_string())
     
     # Query 6: Operational KPI - Urgent Alerts
@@ -164,21 +387,33 @@ def run_analytical_queries(df):
         (df['expiration_status'].isin(['Active', 'No Expiration Set']))
     )
     
-    urgent_alerts = df[urgent_mask][['event', 'area_desc', 'severity', 'urgency', 'expires']].copy()
+    # Gather just the needed columns for the matching rows (no full-width intermediate copy);
+    # .array keeps the categorical and tz-aware dtypes intact
+    urgent_rows = np.flatnonzero(urgent_mask.to_numpy())
+    urgent_alerts = pd.DataFrame({
+        col: df[col].array[urgent_rows]
+        for col in ['event', 'area_desc', 'severity', 'urgency', 'expires']
+    })
     
     if not urgent_alerts.empty:
-        # Calculate minutes until expiration
-        urgent_alerts['minutes_until_expiration'] = (
-            (urgent_alerts['expires'] - pd.Timestamp.now(tz='UTC')).dt.total_seconds() / 60
-        ).round(0)
+        # Calculate minutes until expiration with int64 nanosecond arithmetic
+        # (rounded to the nearest minute; alerts without an expiry stay <NA>)
+        expires = urgent_alerts['expires'].dt.as_unit('ns')
+        minutes = (expires.array.asi8 - now_ns + 30_000_000_000) // 60_000_000_000
+        urgent_alerts['minutes_until_expiration'] = pd.arrays.IntegerArray(
+            minutes.astype(np.int32), expires.isna().to_numpy()
+        )
         urgent_alerts = urgent_alerts.sort_values('minutes_until_expiration')
         print(urgent_alerts.head(10).to_string(index=False))
     else:
         print("No immediate urgent alerts found")
     
     # Query 7: Summary Statistics
+    # One histogram per column covers every "count where" below (severity reuses Query 2)
     print("\n7. SUMMARY STATISTICS:")
     print("-" * 40)
+    status_counts = df['status'].value_counts()
+    urgency_counts = df['urgency'].value_counts()
     summary_stats = pd.DataFrame({
         'metric': [
             'total_alerts',
@@ -190,11 +425,11 @@ def run_analytical_queries(df):
         ],
         'count': [
             len(df),
-            len(df[df['status'] == 'Actual']),
-            len(df[df['status'] == 'Test']),
-            len(df[df['urgency'] == 'Immediate']),
-            len(df[df['severity'] == 'Severe']),
-            len(df[df['severity'] == 'Extreme'])
+            int(status_counts.get('Actual', 0)),
+            int(status_counts.get('Test', 0)),
+            int(urgency_counts.get('Immediate', 0)),
+            int(severity_counts.get('Severe', 0)),
+            int(severity_counts.get('Extreme', 0))
         ]
     })
     print(summary_stats.to_string(index=False))
@@ -222,46 +457,67 @@ def run_analytical_queries(df):
         'data_quality': data_quality
     }
 
-def export_analysis_results(results):
+def _write_analysis_partition(df, output_dir, name):
+    """
+    Write one result to <output_dir>/analysis=<name>/part-0.parquet with its own columns
+    """
+    partition_dir = Path(output_dir) / f'analysis={name}'
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Dot-prefixed temp file (ignored by dataset readers), swapped in once complete
+    path = partition_dir / 'part-0.parquet'
+    tmp_path = partition_dir / '.part-0.parquet.tmp'
+    _compact_for_parquet(df).to_parquet(tmp_path, index=False, **PARQUET_OPTIONS)
+    os.replace(tmp_path, path)
+    return partition_dir.name
+
+def export_analysis_results(results, file_formats=['parquet'], output_dir='analysis_results'):
     """
-    Export analysis results to both CSV and Parquet files
+    Export analysis results as a Parquet dataset with one analysis=<name> partition
+    per result (and as individual CSV files if requested)
     """
     if not results:
         return
     
     # Define the analysis results to export
     exports = {
-        'analysis_event_counts': results['event_counts'],
-        'analysis_severity_breakdown': results['severity_analysis'],
-        'analysis_summary_stats': results['summary_stats'],
-        'analysis_data_quality': results['data_quality']
+        'event_counts': results['event_counts'],
+        'severity_breakdown': results['severity_analysis'],
+        'summary_stats': results['summary_stats'],
+        'data_quality': results['data_quality']
     }
     
-    # Export each result to both CSV and Parquet
-    for filename, data in exports.items():
+    # Also export the top areas and urgent alerts if they exist
+    if 'top_areas' in results and not results['top_areas'].empty:
+        exports['top_areas'] = results['top_areas']
+    
+    if 'urgent_alerts' in results and not results['urgent_alerts'].empty:
+        exports['urgent_alerts'] = results['urgent_alerts']
+    
+    written_partitions = set()
+    for name, data in exports.items():
         if isinstance(data, pd.Series):
             # Convert Series to DataFrame for better export
             df = data.to_frame().reset_index()
+        elif name == 'urgent_alerts':
+            df = data
         else:
             df = data.reset_index() if hasattr(data, 'reset_index') else data
         
-        # Export to CSV
-        df.to_csv(f'{filename}.csv', index=False)
+        if 'csv' in file_formats:
+            df.to_csv(f'analysis_{name}.csv', index=False)
         
-        # Export to Parquet
-        df.to_parquet(f'{filename}.parquet', index=False)
+        if 'parquet' in file_formats:
+            written_partitions.add(_write_analysis_partition(df, output_dir, name))
     
-    # Also export the top areas and urgent alerts if they exist
-    if 'top_areas' in results and not results['top_areas'].empty:
-        top_areas_df = results['top_areas'].to_frame().reset_index()
-        top_areas_df.to_csv('analysis_top_areas.csv', index=False)
-        top_areas_df.to_parquet('analysis_top_areas.parquet', index=False)
-    
-    if 'urgent_alerts' in results and not results['urgent_alerts'].empty:
-        results['urgent_alerts'].to_csv('analysis_urgent_alerts.csv', index=False)
-        results['urgent_alerts'].to_parquet('analysis_urgent_alerts.parquet', index=False)
+    if 'parquet' in file_formats:
+        # Remove partitions left by earlier runs that this run did not produce
+        # (e.g. no urgent alerts), so the dataset never serves stale results
+        for partition_dir in Path(output_dir).glob('analysis=*'):
+            if partition_dir.is_dir() and partition_dir.name not in written_partitions:
+                shutil.rmtree(partition_dir)
     
-    print(f"\n✅ Analysis results exported to both CSV and Parquet files")
+    print(f"\n✅ Analysis results exported to: {', '.join(file_formats)}")
 
 def main():
     """
@@ -277,24 +533,31 @@ def main():
         print("❌ No alerts fetched. Exiting.")
         return
     
-    # Step 2: Save DataFrame to multiple formats
-    save_dataframe(df, ['csv', 'parquet'])
+    # Steps 2 & 3: Save DataFrame in the background while the queries run
+    # (the save gets a shallow copy, since the queries add columns to df)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        save_future = executor.submit(save_dataframe, df.copy(deep=False), ['parquet'])
+        results = run_analytical_queries(df)
+        saved_files = save_future.result()
     
-    # Step 3: Run analytical queries using pandas operations
-    results = run_analytical_queries(df)
+    # Report the background save only once the query output is complete
+    print()
+    for path in saved_files:
+        print(f"✅ Saved to {path}")
     
     # Step 4: Export analysis results
     export_analysis_results(results)
     
     print(f"\n✅ Analysis complete!")
     print(f"📊 Total alerts processed: {len(df)}")
-    print(f"💾 Data saved in dual formats:")
-    print(f"   - weather_alerts.csv/.parquet (main dataset)")
-    print(f"   - analysis_*.csv/.parquet (individual analysis results)")
+    print(f"💾 Data saved as Parquet:")
+    print(f"   - weather_alerts.parquet (main dataset)")
+    print(f"   - analysis_results/ (Parquet dataset, one analysis=<name> partition per result)")
     print(f"🔍 You can explore the data using:")
-    print(f"   - CSV files: Excel, Google Sheets, any spreadsheet app")
     print(f"   - Parquet files: pandas (faster loading)")
-    print(f"   - Python: pd.read_csv() or pd.read_parquet()")
+    print(f"   - CSV files (opt-in via file_formats=['parquet', 'csv']): any spreadsheet app")
+    print(f"   - Python: pd.read_parquet() or pd.read_csv()")
+    print(f"     e.g. pd.read_parquet('analysis_results/analysis=summary_stats')")
     print(f"   - Jupyter notebooks for interactive analysis")
 
 if __name__ == "__main__":